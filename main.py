@@ -1,54 +1,426 @@
 import logging
-from binance import Client
+import logging.handlers
+import atexit
+import queue
+import json
+import asyncio
+import base64
+import hashlib
+import hmac
+import uuid
+import aiohttp
+import orjson
+import websockets
+from binance import Client, AsyncClient
 from binance.exceptions import BinanceAPIException
+from Crypto.PublicKey import ECC
+from Crypto.Signature import eddsa
 import argparse
 import time
 import os
+import socket
+import sys
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote, urlencode, urlsplit, urlunsplit
+from decimal import Decimal
 from dotenv import load_dotenv
-from typing import Optional, Dict, Union
+from typing import Optional, Dict, List, Tuple, Union
 
 # Load environment variables
 load_dotenv()
 
+# Maximum number of orders accepted by a single /fapi/v1/batchOrders request
+BATCH_ORDER_LIMIT = 5
+
+# How long submit() waits for more orders to share a batchOrders request (seconds)
+BATCH_WINDOW = 0.005
+
+# Ping interval that keeps pooled connections inside Binance's 90s keep-alive window
+KEEPALIVE_INTERVAL = 60
+
+# How often the pinned futures host is re-resolved (seconds)
+DNS_REFRESH_INTERVAL = 300
+
+# How long cached exchange filters stay valid before being refetched (seconds)
+FILTERS_TTL = 3600
+
+# Binance error code for a rejected filter (e.g. LOT_SIZE)
+FILTER_FAILURE_CODE = -1013
+
+# How long a fetched balance is reused before asking the exchange again (seconds)
+BALANCE_TTL = 5
+
+# Binance Futures order rate cap (orders per second)
+ORDER_RATE_LIMIT = 10
+
+# Live futures REST hosts probed at startup to pick the lowest-latency one
+FUTURES_HOSTS = [
+    'https://fapi.binance.com',
+    'https://fapi1.binance.com',
+    'https://fapi2.binance.com',
+    'https://fapi3.binance.com',
+    'https://fapi4.binance.com'
+]
+
+# Binance Futures WebSocket API endpoints
+WS_API_URL = 'wss://ws-fapi.binance.com/ws-fapi/v1'
+WS_API_TESTNET_URL = 'wss://testnet.binancefuture.com/ws-fapi/v1'
+
+# Seconds to wait for a WebSocket API response
+WS_RESPONSE_TIMEOUT = 30
+
+def _dumps(obj) -> str:
+    """Serialize to a compact JSON string with orjson."""
+    return orjson.dumps(obj).decode()
+
+def now_ms() -> int:
+    """Current local time in milliseconds."""
+    return time.time_ns() // 1_000_000
+
+def server_time_offset(before_ms: int, server_ms: int, after_ms: int) -> int:
+    """Offset (ms) to add to local time to match Binance server time."""
+    # Assume the server stamped the response halfway through the round trip
+    return server_ms - (before_ms + after_ms) // 2
+
+def _ping_latency(host: str, timeout: float, proxies: Optional[Dict] = None) -> Optional[int]:
+    """Time a GET /fapi/v1/ping to host in nanoseconds, or None if it fails."""
+    start = time.perf_counter_ns()
+    try:
+        requests.get(
+            f'{host}/fapi/v1/ping', timeout=timeout, proxies=proxies
+        ).raise_for_status()
+    except requests.RequestException:
+        return None
+    return time.perf_counter_ns() - start
+
+def fastest_futures_url(timeout: float = 2, proxies: Optional[Dict] = None) -> Optional[str]:
+    """
+    Probe every host in FUTURES_HOSTS in parallel (through proxies, if given).
+    
+    Returns:
+        The futures API base URL (client.FUTURES_URL format) of the fastest
+        responding host, or None if none responded.
+    """
+    with ThreadPoolExecutor(max_workers=len(FUTURES_HOSTS)) as pool:
+        latencies = pool.map(
+            lambda host: _ping_latency(host, timeout, proxies), FUTURES_HOSTS
+        )
+        results = [
+            (latency, host) for latency, host in zip(latencies, FUTURES_HOSTS)
+            if latency is not None
+        ]
+    if not results:
+        return None
+    return f'{min(results)[1]}/fapi'
+
+# Background thread writing queued log records; started by the first setup_logging()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def set_futures_url(client: Union[Client, AsyncClient], testnet: bool, endpoint: str) -> None:
+    """Point a client's futures REST calls at endpoint (e.g. https://fapi.binance.com)."""
+    futures_url = f"{endpoint.rstrip('/')}/fapi"
+    if testnet:
+        client.FUTURES_TESTNET_URL = futures_url
+    else:
+        client.FUTURES_URL = futures_url
+
+def select_futures_url(
+    client: Union[Client, AsyncClient],
+    testnet: bool,
+    endpoint: Optional[str],
+    proxies: Optional[Dict] = None
+) -> Optional[str]:
+    """
+    Route a client's futures calls to endpoint, or to the lowest-latency live host.
+    
+    Blocks while probing FUTURES_HOSTS, so async callers run it in an executor.
+    
+    Returns:
+        The endpoint or futures URL chosen, or None if the client's default is kept.
+    """
+    if endpoint:
+        set_futures_url(client, testnet, endpoint)
+        return endpoint
+    if testnet:
+        return None
+    futures_url = fastest_futures_url(proxies=proxies)
+    if futures_url:
+        client.FUTURES_URL = futures_url
+    return futures_url
+
+def proxy_params(proxy: Optional[str]) -> Optional[Dict]:
+    """requests-style proxies dict for a proxy URL, or None."""
+    return {'http': proxy, 'https': proxy} if proxy else None
+
+def setup_logging(name: str) -> logging.Logger:
+    """
+    Configure logging and return the named logger.
+    
+    File output runs on a QueueListener thread, so logging from the order
+    path only enqueues the record instead of writing to disk. Console
+    output stays synchronous so it keeps its place among printed results.
+    """
+    global _log_listener
+    if _log_listener is None:
+        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        file_handler = logging.FileHandler('trading_bot.log', delay=True)
+        file_handler.setFormatter(logging.Formatter(log_format))
+        
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        logging.basicConfig(
+            level=logging.INFO,
+            format=log_format,
+            handlers=[logging.StreamHandler()]
+        )
+        # Added after basicConfig, which would give it the console format too
+        logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    return logging.getLogger(name)
+
+# Fixed params for each CLI order type, including its Binance Futures order type.
+# build_order_params copies one and fills in only the per-order fields.
+_ORDER_TEMPLATES = {
+    'MARKET': {'type': 'MARKET'},
+    'LIMIT': {'type': 'LIMIT', 'timeInForce': 'GTC'},
+    'STOP': {'type': 'STOP_MARKET'},
+    'TRAILING_STOP': {'type': 'TRAILING_STOP_MARKET', 'workingType': 'MARK_PRICE'}
+}
+
+# Normalized (uppercased, interned) symbols keyed by the caller's spelling
+_SYMBOLS: Dict[str, str] = {}
+
+def normalize_symbol(symbol: str) -> str:
+    """Uppercase a symbol once and reuse the interned result afterwards."""
+    normalized = _SYMBOLS.get(symbol)
+    if normalized is None:
+        normalized = _SYMBOLS[symbol] = sys.intern(symbol.upper())
+    return normalized
+
+def build_order_params(
+    symbol: str,
+    side: str,
+    order_type: str,
+    quantity: float,
+    price: Optional[float] = None,
+    stop_price: Optional[float] = None,
+    trailing_delta: Optional[int] = None
+) -> Dict:
+    """Build the Binance order params shared by every order path."""
+    template = _ORDER_TEMPLATES.get(order_type)
+    params = template.copy() if template else {'type': order_type}
+    params['symbol'] = normalize_symbol(symbol)
+    params['side'] = side
+    params['quantity'] = quantity
+
+    # Add conditional parameters
+    if price:
+        params['price'] = price
+        params['timeInForce'] = 'GTC'
+
+    if stop_price:
+        params['stopPrice'] = stop_price
+
+    if trailing_delta:
+        params['callbackRate'] = trailing_delta
+        # Without an activation price the trailing stop activates immediately
+        if stop_price:
+            params['activationPrice'] = stop_price
+
+    return params
+
+class PinnedHostAdapter(HTTPAdapter):
+    """HTTPAdapter that connects to a pre-resolved IP for one hostname."""
+    
+    def __init__(self, hostname: str, **kwargs):
+        """
+        Args:
+            hostname: Host whose requests are sent to the pinned IP
+            **kwargs: Passed through to HTTPAdapter
+        """
+        self.hostname = hostname
+        self.ip = socket.gethostbyname(hostname)
+        self.resolved_at = time.time()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        # SNI and certificate checks still use the real hostname
+        kwargs['server_hostname'] = self.hostname
+        kwargs['assert_hostname'] = self.hostname
+        super().init_poolmanager(*args, **kwargs)
+
+    def refresh(self) -> None:
+        """Re-resolve the hostname and pin the current address."""
+        self.ip = socket.gethostbyname(self.hostname)
+        self.resolved_at = time.time()
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        if url.hostname == self.hostname:
+            netloc = self.ip if url.port is None else f'{self.ip}:{url.port}'
+            request.url = urlunsplit(url._replace(netloc=netloc))
+            request.headers['Host'] = self.hostname
+        return super().send(request, **kwargs)
+
+def decrypt_private_key(private_key: Optional[str], passphrase: Optional[str]) -> Optional[str]:
+    """
+    Return the Ed25519 private key PEM unencrypted.
+    
+    python-binance treats long PEMs as RSA and never passes the passphrase
+    to Ed25519 keys, so encrypted keys are decrypted once here instead.
+    """
+    if not private_key or not passphrase:
+        return private_key
+    return ECC.import_key(private_key, passphrase=passphrase).export_key(format='PEM')
+
+class RequestSigner:
+    """Signs Binance request payloads with HMAC-SHA256 or an Ed25519 key."""
+    
+    def __init__(
+        self,
+        api_secret: Optional[str] = None,
+        private_key: Optional[str] = None,
+        private_key_pass: Optional[str] = None
+    ):
+        """
+        Args:
+            api_secret: Binance API secret (HMAC keys)
+            private_key: PEM contents of an Ed25519 private key (takes precedence)
+            private_key_pass: Passphrase for the private key, if encrypted
+        """
+        self._secret = api_secret.encode() if api_secret else None
+        self._ed25519 = None
+        if private_key:
+            key = ECC.import_key(private_key, passphrase=private_key_pass)
+            self._ed25519 = eddsa.new(key, 'rfc8032')
+
+    def sign(self, payload: str) -> str:
+        """Return the signature for a query-string payload."""
+        if self._ed25519 is not None:
+            return base64.b64encode(self._ed25519.sign(payload.encode())).decode()
+        return hmac.new(self._secret, payload.encode(), hashlib.sha256).hexdigest()
+
 class BinanceFuturesBot:
     """A trading bot for Binance Futures with enhanced features."""
     
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
+    # LOT_SIZE filters shared by every bot on the same exchange:
+    # (testnet, tld) -> (filters by symbol, fetch time)
+    _CLASS_FILTERS: Dict[Tuple[bool, str], Tuple[Dict[str, tuple], float]] = {}
+    
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: Optional[str] = None,
+        testnet: bool = True,
+        private_key: Optional[str] = None,
+        private_key_pass: Optional[str] = None,
+        proxy: Optional[str] = None,
+        endpoint: Optional[str] = None
+    ):
         """
         Initialize the trading bot with API credentials.
         
         Args:
             api_key: Binance API key
-            api_secret: Binance API secret
+            api_secret: Binance API secret (not needed with private_key)
             testnet: Whether to use testnet (default: True)
+            private_key: PEM contents of an Ed25519 private key registered
+                with the API key, used instead of HMAC signing
+            private_key_pass: Passphrase for the private key, if encrypted
+            proxy: HTTP(S)/SOCKS5 proxy URL for all API traffic, e.g. a
+                host in AWS ap-northeast-1 (Tokyo) next to the exchange
+            endpoint: Futures REST base URL (e.g. https://fapi.binance.com),
+                skipping the startup endpoint probe
         """
         self.session = None
+        self._filters_cache = {}
+        self._filters_ts = 0
+        self._filters_key = (testnet, 'com')
+        self._balance_cache: Dict[str, Tuple[float, float]] = {}
+        self._templates: Dict[str, str] = {}
+        private_key = decrypt_private_key(private_key, private_key_pass)
+        self._signer = RequestSigner(api_secret, private_key)
+        self.testnet = testnet
+        self._pinned_adapter: Optional[PinnedHostAdapter] = None
+        self._proxies = proxy_params(proxy)
         self._setup_logging()
-        self.client = self._initialize_client(api_key, api_secret, testnet)
+        self.client = self._initialize_client(
+            api_key, api_secret, testnet, private_key, endpoint
+        )
+        self._keepalive_timer = None
+        self._schedule_keepalive()
         self.logger.info(f"Bot initialized in {'TESTNET' if testnet else 'LIVE'} mode")
 
     def _setup_logging(self) -> None:
         """Configure logging for the bot."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('trading_bot.log'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger('BinanceFuturesBot')
+        self.logger = setup_logging('BinanceFuturesBot')
 
-    def _initialize_client(self, api_key: str, api_secret: str, testnet: bool) -> Client:
+    def _initialize_client(
+        self,
+        api_key: str,
+        api_secret: Optional[str],
+        testnet: bool,
+        private_key: Optional[str] = None,
+        endpoint: Optional[str] = None
+    ) -> Client:
         """Initialize and verify Binance client connection."""
         try:
+            requests_params = {'timeout': 30}
+            if self._proxies:
+                requests_params['proxies'] = self._proxies
+                
             client = Client(
                 api_key,
                 api_secret,
                 testnet=testnet,
-                requests_params={'timeout': 30},
+                requests_params=requests_params,
                 tld='com',
+                private_key=private_key,
+            )
+            
+            # Reuse pooled keep-alive connections instead of a new TLS handshake per request
+            client.session.headers.update({
+                'Connection': 'keep-alive',
+                'Keep-Alive': 'timeout=90, max=1000'
+            })
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0)
+            client.session.mount('https://', adapter)
+            
+            # Route traffic to the requested or lowest-latency futures host
+            futures_url = select_futures_url(client, testnet, endpoint, self._proxies)
+            if futures_url:
+                self.logger.info(f"Using futures endpoint {futures_url}")
+            
+            # Resolve the futures host once so reconnects skip the DNS lookup.
+            # Behind a proxy (explicit or from HTTPS_PROXY etc.), the proxy
+            # resolves the host instead and pinning would break TLS.
+            futures_url = client.FUTURES_TESTNET_URL if testnet else client.FUTURES_URL
+            # get_environ_proxies also returns NO_PROXY under 'no', so ask
+            # whether a proxy actually applies to the futures URL
+            env_proxy = client.session.trust_env and requests.utils.select_proxy(
+                futures_url, requests.utils.get_environ_proxies(futures_url)
             )
+            if not self._proxies and not env_proxy:
+                futures_host = urlsplit(futures_url).hostname
+                try:
+                    self._pinned_adapter = PinnedHostAdapter(
+                        futures_host, pool_connections=4, pool_maxsize=20, max_retries=0
+                    )
+                    client.session.mount(f'https://{futures_host}', self._pinned_adapter)
+                except OSError as e:
+                    self.logger.warning(f" Could not pin {futures_host}, using normal DNS: {str(e)}")
+            
+            # Sync to server time once; python-binance adds timestamp_offset to
+            # every signed request, and the template/WebSocket paths use it too
+            before = now_ms()
+            server_ms = client.futures_time()['serverTime']
+            client.timestamp_offset = server_time_offset(before, server_ms, now_ms())
             
             # Test connection
             client.futures_account()
@@ -62,6 +434,34 @@ class BinanceFuturesBot:
             self.logger.error(f" Unexpected connection error: {str(e)}")
             raise
 
+    def _schedule_keepalive(self) -> None:
+        """Schedule the next keep-alive ping on a daemon timer."""
+        self._keepalive_timer = threading.Timer(KEEPALIVE_INTERVAL, self._keepalive)
+        self._keepalive_timer.daemon = True
+        self._keepalive_timer.start()
+
+    def _keepalive(self) -> None:
+        """Ping the futures API so the pooled connection stays warm."""
+        pinned = self._pinned_adapter
+        if pinned is not None and time.time() - pinned.resolved_at > DNS_REFRESH_INTERVAL:
+            try:
+                pinned.refresh()
+            except OSError as e:
+                self.logger.warning(f" DNS refresh for {pinned.hostname} failed: {str(e)}")
+        try:
+            self.client.futures_ping()
+        except Exception as e:
+            self.logger.warning(f" Keep-alive ping failed: {str(e)}")
+        if self._keepalive_timer is not None:
+            self._schedule_keepalive()
+
+    def close(self) -> None:
+        """Stop the keep-alive timer and close the HTTP session."""
+        if self._keepalive_timer is not None:
+            self._keepalive_timer.cancel()
+            self._keepalive_timer = None
+        self.client.session.close()
+
     def place_order(
         self,
         symbol: str,
@@ -70,104 +470,785 @@ class BinanceFuturesBot:
         quantity: float,
         price: Optional[float] = None,
         stop_price: Optional[float] = None,
-        trailing_delta: Optional[int] = None
+        trailing_delta: Optional[int] = None,
+        validate: bool = False
     ) -> Dict:
-        """Place an order on Binance Futures."""
+        """
+        Place an order on Binance Futures.
+        
+        With validate=True the quantity is checked and rounded against the
+        symbol's LOT_SIZE filter first. It is off by default so strategies
+        that already send step-aligned quantities skip the extra work (and
+        the exchange_info fetch when the filter cache is cold).
+        """
         try:
-            # Correct order type mapping
-            type_map = {
-                'MARKET': 'MARKET',
-                'LIMIT': 'LIMIT',
-                'STOP': 'STOP_MARKET',
-                'TRAILING_STOP': 'TRAILING_STOP_MARKET'
-            }
-            
-            params = {
-                'symbol': symbol.upper(),
-                'side': side,
-                'type': type_map.get(order_type, order_type),
-                'quantity': quantity,
-                'timestamp': int(time.time() * 1000)
-            }
-            
-            # Add conditional parameters
-            if price:
-                params['price'] = price
-                params['timeInForce'] = 'GTC'
-                
-            if stop_price:
-                params['stopPrice'] = stop_price
-                
-            if trailing_delta:
-                params['activationPrice'] = stop_price
-                params['callbackRate'] = trailing_delta
-                params['workingType'] = 'MARK_PRICE'
+            params = build_order_params(
+                symbol, side, order_type, quantity, price, stop_price, trailing_delta
+            )
+            if validate:
+                params['quantity'] = self._validate_quantity(params['symbol'], quantity)
                 
-            self.logger.info(f"Placing order with params: {params}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Placing order with params: %s", params)
             
             # Special handling for trailing stop
             response = self.client.futures_create_order(**params)
+            self._balance_cache.clear()
             
-            self.logger.info(f"Order placed successfully: {response}")
+            self.logger.info("Order placed successfully: %s", response)
             return response
             
         except BinanceAPIException as e:
-            self.logger.error(f"API Error {e.status_code}: {e.message}")
+            self._handle_order_error(e)
             raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
+        except Exception:
+            self.logger.exception("Unexpected error")
+            raise
+
+    def place_batch(self, orders: List[Dict], validate: bool = False) -> List[Dict]:
+        """
+        Place several orders through the Binance Futures batchOrders endpoint.
+        
+        Orders are sent in chunks of up to 5 (the exchange limit), so N orders
+        cost ceil(N / 5) round trips instead of N.
+        
+        Args:
+            orders: Order specs using the same keyword names as place_order
+                (symbol, side, order_type, quantity, price, stop_price,
+                trailing_delta)
+            validate: Check and round each quantity against LOT_SIZE first
+        
+        Returns:
+            One result per order, in input order. Rejected orders come back
+            as {'code': ..., 'msg': ...} entries instead of raising. If a
+            whole request fails, each order in it gets such an entry and
+            the remaining chunks are still sent, so results for orders
+            that already reached the exchange are not lost.
+        """
+        try:
+            batch_params = []
+            for order in orders:
+                params = build_order_params(**order)
+                if validate:
+                    params['quantity'] = self._validate_quantity(
+                        params['symbol'], params['quantity']
+                    )
+                # Binance rejects numeric JSON values in batchOrders with code 400
+                batch_params.append({k: str(v) for k, v in params.items()})
+        except Exception:
+            self.logger.exception("Unexpected error")
+            raise
+            
+        responses = []
+        for i in range(0, len(batch_params), BATCH_ORDER_LIMIT):
+            chunk = batch_params[i:i + BATCH_ORDER_LIMIT]
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Placing batch of %d orders: %s", len(chunk), chunk)
+                
+            try:
+                # python-binance JSON-encodes the list into the batchOrders param
+                result = self.client.futures_place_batch_order(batchOrders=chunk)
+            except BinanceAPIException as e:
+                self._handle_order_error(e)
+                result = [{'code': e.code, 'msg': e.message} for _ in chunk]
+            except Exception as e:
+                self.logger.exception("Unexpected error")
+                # The request may or may not have reached the exchange
+                msg = f"Batch request failed, order status unknown: {str(e)}"
+                result = [{'code': None, 'msg': msg} for _ in chunk]
+            else:
+                self._balance_cache.clear()
+                self.logger.info("Batch placed: %s", result)
+            responses.extend(result)
+        return responses
+
+    def register_template(
+        self,
+        name: str,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: Optional[float] = None,
+        stop_price: Optional[float] = None,
+        trailing_delta: Optional[int] = None
+    ) -> None:
+        """
+        Pre-encode an order that will be sent repeatedly.
+        
+        The query string is built once here; place_template only appends the
+        timestamp and signature before posting it.
+        """
+        params = build_order_params(
+            symbol, side, order_type, quantity, price, stop_price, trailing_delta
+        )
+        self._templates[name] = urlencode(params) + '&timestamp='
+        self.logger.info(f"Registered order template '{name}': {params}")
+
+    def place_template(self, name: str) -> Dict:
+        """Place an order registered with register_template."""
+        try:
+            payload = f"{self._templates[name]}{now_ms() + self.client.timestamp_offset}"
+            body = f"{payload}&signature={quote(self._signer.sign(payload), safe='')}"
+            
+            base_url = self.client.FUTURES_TESTNET_URL if self.testnet else self.client.FUTURES_URL
+            response = self.client.session.post(
+                f"{base_url}/v1/order",
+                data=body,
+                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                timeout=30,
+                proxies=self._proxies
+            )
+            if not response.ok:
+                raise BinanceAPIException(response, response.status_code, response.text)
+            self._balance_cache.clear()
+            
+            result = response.json()
+            self.logger.info("Order placed successfully: %s", result)
+            return result
+            
+        except BinanceAPIException as e:
+            self._handle_order_error(e)
+            raise
+        except Exception:
+            self.logger.exception("Unexpected error")
             raise
 
-    def _validate_quantity(self, symbol: str, quantity: float) -> float:
-        """Validate quantity against Binance's LOT_SIZE rules."""
-        info = self.client.futures_exchange_info()
+    @staticmethod
+    def _fetch_filters(client: Client) -> Dict[str, tuple]:
+        """Fetch exchange info and index LOT_SIZE filters by symbol."""
+        info = client.futures_exchange_info()
+        filters = {}
         for symbol_info in info['symbols']:
-            if symbol_info['symbol'] == symbol:
-                for filter in symbol_info['filters']:
-                    if filter['filterType'] == 'LOT_SIZE':
-                        min_qty = float(filter['minQty'])
-                        max_qty = float(filter['maxQty'])
-                        step_size = float(filter['stepSize'])
-                        
-                        if quantity < min_qty or quantity > max_qty:
-                            raise ValueError(
-                                f"Quantity must be between {min_qty} and {max_qty}"
-                            )
-                            
-                        # Round to step size
-                        return round(quantity / step_size) * step_size
-        return quantity
+            for symbol_filter in symbol_info['filters']:
+                if symbol_filter['filterType'] == 'LOT_SIZE':
+                    step_size = float(symbol_filter['stepSize'])
+                    # Decimal places of the step, e.g. '0.00100000' -> 3
+                    precision = max(
+                        0, -Decimal(symbol_filter['stepSize']).normalize().as_tuple().exponent
+                    )
+                    # (min_qty, max_qty, step_size, inv_step, precision)
+                    filters[symbol_info['symbol']] = (
+                        float(symbol_filter['minQty']),
+                        float(symbol_filter['maxQty']),
+                        step_size,
+                        1.0 / step_size,
+                        precision
+                    )
+                    break
+        return filters
+
+    @classmethod
+    def preload_filters(cls, testnet: bool = True) -> None:
+        """
+        Warm the shared filter cache before creating bots.
+        
+        Exchange info is public, so no API keys are needed.
+        """
+        client = Client(testnet=testnet, requests_params={'timeout': 30}, tld='com', ping=False)
+        try:
+            cls._CLASS_FILTERS[(testnet, 'com')] = (cls._fetch_filters(client), time.time())
+        finally:
+            client.close_connection()
+
+    def _load_filters(self) -> None:
+        """Load LOT_SIZE filters from the shared cache, fetching them if stale."""
+        cached = self._CLASS_FILTERS.get(self._filters_key)
+        if cached is None or time.time() - cached[1] > FILTERS_TTL:
+            cached = (self._fetch_filters(self.client), time.time())
+            self._CLASS_FILTERS[self._filters_key] = cached
+        self._filters_cache, self._filters_ts = cached
+
+    def _handle_order_error(self, e: BinanceAPIException) -> None:
+        """Log a rejected order and drop cached filters if they caused it."""
+        self.logger.error("API Error %s: %s", e.status_code, e.message)
+        if e.code == FILTER_FAILURE_CODE:
+            # Exchange rules may have changed; refetch on next validation
+            self._invalidate_filters()
+
+    def _invalidate_filters(self) -> None:
+        """Force the next validation to refetch filters for every bot."""
+        self._CLASS_FILTERS.pop(self._filters_key, None)
+        self._filters_ts = 0
+
+    def _validate_quantity(self, symbol: str, quantity: float) -> str:
+        """
+        Validate quantity against Binance's LOT_SIZE rules.
+        
+        Returns:
+            The quantity rounded to the symbol's step size, formatted with
+            the step's precision so it can be sent as-is.
+        """
+        if (time.time() - self._filters_ts > FILTERS_TTL
+                or self._filters_key not in self._CLASS_FILTERS):
+            self._load_filters()
+            
+        lot_size = self._filters_cache.get(symbol)
+        if lot_size is None:
+            return str(quantity)
+        min_qty, max_qty, step_size, inv_step, precision = lot_size
+            
+        if quantity < min_qty or quantity > max_qty:
+            raise ValueError(
+                f"Quantity must be between {min_qty} and {max_qty}"
+            )
+            
+        # Round to step size in whole steps, then format at the step's precision
+        return format(int(round(quantity * inv_step)) * step_size, f'.{precision}f')
 
     def get_balance(self, asset: str = 'USDT') -> float:
         """Get available futures balance for an asset."""
+        if (cached := self._balance_cache.get(asset)) and time.time() - cached[1] < BALANCE_TTL:
+            return cached[0]
+            
         try:
-            balance = next(
-                (item for item in self.client.futures_account_balance() 
-                 if item['asset'] == asset),
-                None
+            # One request returns every asset, so cache them all
+            fetched_at = time.time()
+            balances = {}
+            for item in self.client.futures_account_balance():
+                balances[item['asset']] = (float(item['availableBalance']), fetched_at)
+            self._balance_cache = balances
+            return balances.get(asset, (0.0, fetched_at))[0]
+        except Exception as e:
+            self.logger.error(f" Failed to get balance: {str(e)}")
+            raise
+
+class AsyncRateLimiter:
+    """Token bucket limiting how many requests start per second."""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (default: rate)
+        """
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+class AsyncBinanceFuturesBot:
+    """Asyncio variant of BinanceFuturesBot for placing orders concurrently."""
+    
+    def __init__(
+        self,
+        client: AsyncClient,
+        testnet: bool = True,
+        signer: Optional[RequestSigner] = None,
+        proxy: Optional[str] = None
+    ):
+        """Use AsyncBinanceFuturesBot.create() to build a connected bot."""
+        self.client = client
+        self.testnet = testnet
+        self.proxy = proxy
+        self._signer = signer or RequestSigner(client.API_SECRET)
+        self.logger = setup_logging('AsyncBinanceFuturesBot')
+        self._rate_limiter = AsyncRateLimiter(ORDER_RATE_LIMIT)
+        self._ws = None
+        self._ws_reader = None
+        self._ws_pending: Dict[str, asyncio.Future] = {}
+        self._ws_connect_lock = asyncio.Lock()
+        self._order_q: asyncio.Queue = asyncio.Queue()
+        self._batcher = None
+        self._batches_in_flight = set()
+        self.logger.info(f"Async bot initialized in {'TESTNET' if testnet else 'LIVE'} mode")
+
+    @classmethod
+    async def create(
+        cls,
+        api_key: str,
+        api_secret: Optional[str] = None,
+        testnet: bool = True,
+        private_key: Optional[str] = None,
+        private_key_pass: Optional[str] = None,
+        proxy: Optional[str] = None,
+        endpoint: Optional[str] = None
+    ) -> 'AsyncBinanceFuturesBot':
+        """
+        Create the bot and verify the Binance connection.
+        
+        Args:
+            api_key: Binance API key
+            api_secret: Binance API secret (not needed with private_key)
+            testnet: Whether to use testnet (default: True)
+            private_key: PEM contents of an Ed25519 private key
+            private_key_pass: Passphrase for the private key, if encrypted
+            proxy: HTTP(S) proxy URL for all API traffic
+            endpoint: Futures REST base URL, skipping the endpoint probe
+        """
+        # aiohttp only speaks to HTTP proxies; socks5:// is sync-only
+        if proxy and urlsplit(proxy).scheme not in ('http', 'https'):
+            raise ValueError("Concurrent orders need an http:// or https:// proxy")
+        
+        private_key = decrypt_private_key(private_key, private_key_pass)
+        
+        # One pooled keep-alive session shared by every concurrent request
+        connector = aiohttp.TCPConnector(limit=20, keepalive_timeout=90)
+        client = await AsyncClient.create(
+            api_key,
+            api_secret,
+            testnet=testnet,
+            requests_params={'timeout': 30},
+            tld='com',
+            session_params={'connector': connector},
+            private_key=private_key,
+            https_proxy=proxy,
+        )
+        
+        try:
+            # Route traffic to the requested or lowest-latency futures host
+            await asyncio.get_running_loop().run_in_executor(
+                None, select_futures_url, client, testnet, endpoint, proxy_params(proxy)
+            )
+            
+            # AsyncClient.create already set timestamp_offset from the spot
+            # /time endpoint without latency compensation; this futures
+            # measurement replaces it, matching the sync bot
+            before = now_ms()
+            server_ms = (await client.futures_time())['serverTime']
+            client.timestamp_offset = server_time_offset(before, server_ms, now_ms())
+            
+            # Test connection
+            await client.futures_account()
+        except Exception:
+            await client.close_connection()
+            raise
+            
+        bot = cls(
+            client, testnet, RequestSigner(api_secret, private_key), proxy
+        )
+        bot.logger.info("✅ Successfully connected to Binance Futures API")
+        return bot
+
+    async def close(self) -> None:
+        """Stop the order batcher and close the WebSocket and HTTP connections."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+            # Let the batcher cancel the orders it was still collecting
+            await asyncio.gather(self._batcher, return_exceptions=True)
+            self._batcher = None
+            while not self._order_q.empty():
+                _, future = self._order_q.get_nowait()
+                future.cancel()
+            await asyncio.gather(*self._batches_in_flight, return_exceptions=True)
+        if self._ws is not None:
+            await self._ws.close()
+        if self._ws_reader is not None:
+            # A failed reader must not keep the HTTP session from closing
+            await asyncio.gather(self._ws_reader, return_exceptions=True)
+            self._ws_reader = None
+        await self.client.close_connection()
+
+    async def connect_ws(self) -> None:
+        """Open the persistent WebSocket API connection used by ws_place_order."""
+        url = WS_API_TESTNET_URL if self.testnet else WS_API_URL
+        if self.proxy:
+            self._ws = await websockets.connect(url, proxy=self.proxy)
+        else:
+            self._ws = await websockets.connect(url)
+        self._ws_reader = asyncio.create_task(self._read_ws(self._ws))
+        self.logger.info(f"✅ Connected to Binance Futures WebSocket API: {url}")
+
+    async def _read_ws(self, ws) -> None:
+        """Resolve pending WebSocket API requests as their responses arrive."""
+        try:
+            async for message in ws:
+                future = None
+                try:
+                    data = orjson.loads(message)
+                    future = self._ws_pending.pop(data.get('id'), None)
+                    if future is None or future.done():
+                        continue
+                    if data.get('status') == 200:
+                        future.set_result(data['result'])
+                    else:
+                        future.set_exception(BinanceAPIException(
+                            None, data.get('status'), _dumps(data.get('error', {}))
+                        ))
+                except Exception as e:
+                    # A bad frame fails only its own request, not the connection
+                    self.logger.warning(f" Malformed WebSocket API response: {str(e)}")
+                    if future is not None and not future.done():
+                        future.set_exception(ValueError(f"Malformed response: {str(e)}"))
+        except websockets.ConnectionClosed as e:
+            self.logger.warning(f" WebSocket API connection closed: {str(e)}")
+        finally:
+            # Nothing else will answer requests still in flight
+            for future in self._ws_pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("WebSocket API connection closed"))
+            self._ws_pending.clear()
+            # Binance closes connections routinely; the next order reconnects
+            if self._ws is ws:
+                self._ws = None
+            await ws.close()
+
+    async def place_order_async(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: Optional[float] = None,
+        stop_price: Optional[float] = None,
+        trailing_delta: Optional[int] = None
+    ) -> Dict:
+        """Place an order on Binance Futures without blocking other orders."""
+        try:
+            params = build_order_params(
+                symbol, side, order_type, quantity, price, stop_price, trailing_delta
             )
-            return float(balance['availableBalance']) if balance else 0.0
+            
+            await self._rate_limiter.acquire()
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Placing order with params: %s", params)
+            
+            response = await self.client.futures_create_order(**params)
+            
+            self.logger.info("Order placed successfully: %s", response)
+            return response
+            
+        except BinanceAPIException as e:
+            self.logger.error("API Error %s: %s", e.status_code, e.message)
+            raise
+        except Exception:
+            self.logger.exception("Unexpected error")
+            raise
+
+    async def ws_place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: Optional[float] = None,
+        stop_price: Optional[float] = None,
+        trailing_delta: Optional[int] = None
+    ) -> Dict:
+        """
+        Place an order through the WebSocket API (order.place).
+        
+        Reuses one open connection, so orders skip the per-request HTTP
+        and TLS setup of the REST endpoint. Connects on first use.
+        """
+        try:
+            async with self._ws_connect_lock:
+                if self._ws is None:
+                    await self.connect_ws()
+                ws = self._ws
+                
+            params = {
+                k: str(v) for k, v in build_order_params(
+                    symbol, side, order_type, quantity, price, stop_price, trailing_delta
+                ).items()
+            }
+            
+            await self._rate_limiter.acquire()
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Placing order via WebSocket with params: %s", params)
+            
+            params['apiKey'] = self.client.API_KEY
+            params['timestamp'] = now_ms() + self.client.timestamp_offset
+            
+            # WebSocket API signs the alphabetically sorted params
+            payload = urlencode(sorted(params.items()))
+            params['signature'] = self._signer.sign(payload)
+            
+            request_id = uuid.uuid4().hex
+            future = asyncio.get_running_loop().create_future()
+            self._ws_pending[request_id] = future
+            try:
+                # The reader resets _ws when it stops; nothing would answer us
+                if self._ws is not ws:
+                    raise ConnectionError("WebSocket API connection closed")
+                await ws.send(_dumps({
+                    'id': request_id,
+                    'method': 'order.place',
+                    'params': params
+                }))
+                response = await asyncio.wait_for(future, WS_RESPONSE_TIMEOUT)
+            finally:
+                self._ws_pending.pop(request_id, None)
+            
+            self.logger.info("Order placed successfully: %s", response)
+            return response
+            
+        except BinanceAPIException as e:
+            self.logger.error("API Error %s: %s", e.status_code, e.message)
+            raise
+        except Exception:
+            self.logger.exception("Unexpected error")
+            raise
+
+    def submit(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: Optional[float] = None,
+        stop_price: Optional[float] = None,
+        trailing_delta: Optional[int] = None
+    ) -> asyncio.Future:
+        """
+        Queue an order to be sent in the next batchOrders request.
+        
+        Orders submitted within BATCH_WINDOW of each other share one request
+        (up to 5 per request), so bursts cost fewer round trips while a lone
+        order waits at most BATCH_WINDOW.
+        
+        Returns:
+            A future resolving to the order response, or raising
+            BinanceAPIException if the exchange rejected the order.
+        """
+        if self._batcher is None:
+            self._batcher = asyncio.create_task(self._run_batcher())
+            
+        future = asyncio.get_running_loop().create_future()
+        order = build_order_params(
+            symbol, side, order_type, quantity, price, stop_price, trailing_delta
+        )
+        self._order_q.put_nowait((order, future))
+        return future
+
+    async def _run_batcher(self) -> None:
+        """Group queued orders into batchOrders requests."""
+        batch = []
+        try:
+            while True:
+                batch = [await self._order_q.get()]
+                await asyncio.sleep(BATCH_WINDOW)
+                while len(batch) < BATCH_ORDER_LIMIT and not self._order_q.empty():
+                    batch.append(self._order_q.get_nowait())
+                    
+                # Send without waiting so the next batch can start collecting
+                task = asyncio.create_task(self._send_batch(batch))
+                self._batches_in_flight.add(task)
+                task.add_done_callback(self._batches_in_flight.discard)
+                batch = []
+        except asyncio.CancelledError:
+            # Orders collected but not yet sent are already off the queue
+            for _, future in batch:
+                future.cancel()
+            raise
+
+    async def _send_batch(self, batch: List[Tuple[Dict, asyncio.Future]]) -> None:
+        """Send one batchOrders request and resolve each order's future."""
+        try:
+            for _ in batch:
+                await self._rate_limiter.acquire()
+            # Binance rejects numeric JSON values in batchOrders with code 400
+            orders = [{k: str(v) for k, v in order.items()} for order, _ in batch]
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Placing batch of %d orders: %s", len(orders), orders)
+                
+            results = await self.client.futures_place_batch_order(batchOrders=orders)
+            self.logger.info("Batch placed: %s", results)
+            
+        except Exception as e:
+            self.logger.exception("Batch failed")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+            
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if 'orderId' in result:
+                future.set_result(result)
+            else:
+                future.set_exception(BinanceAPIException(None, 400, _dumps(result)))
+
+    async def get_balance(self, asset: str = 'USDT') -> float:
+        """Get available futures balance for an asset."""
+        try:
+            for item in await self.client.futures_account_balance():
+                if item['asset'] == asset:
+                    return float(item['availableBalance'])
+            return 0.0
         except Exception as e:
             self.logger.error(f" Failed to get balance: {str(e)}")
             raise
 
+    async def place_orders(self, orders: List[Dict]) -> List[Union[Dict, Exception]]:
+        """
+        Place several orders concurrently.
+        
+        Returns:
+            One result per order, in input order. Failed orders are returned
+            as their exception instead of cancelling the others.
+        """
+        tasks = [self.place_order_async(**order) for order in orders]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+async def place_orders_concurrently(
+    api_key: str,
+    api_secret: Optional[str],
+    testnet: bool,
+    orders: List[Dict],
+    private_key: Optional[str] = None,
+    proxy: Optional[str] = None,
+    endpoint: Optional[str] = None
+) -> List[Union[Dict, Exception]]:
+    """
+    Connect an AsyncBinanceFuturesBot, show the balance, place the orders
+    and disconnect.
+    """
+    bot = await AsyncBinanceFuturesBot.create(
+        api_key, api_secret, testnet, private_key, proxy=proxy, endpoint=endpoint
+    )
+    try:
+        print_balance(await bot.get_balance())
+        return await bot.place_orders(orders)
+    finally:
+        await bot.close()
+
+# Order sides and types accepted on the command line
+ORDER_SIDES = ['BUY', 'SELL']
+ORDER_TYPES = ['MARKET', 'LIMIT', 'STOP', 'TRAILING_STOP']
+
+# Keys of an --order / --orders_file spec and the type each value is converted to
+_ORDER_SPEC_TYPES = {
+    'symbol': str,
+    'side': str,
+    'type': str,
+    'quantity': float,
+    'price': float,
+    'stop_price': float,
+    'trailing_delta': int
+}
+_REQUIRED_SPEC_KEYS = ('symbol', 'side', 'type', 'quantity')
+
+# Order types that need an extra argument: (attribute, error message)
+_REQUIRED_ARGS = {
+    'LIMIT': ('price', "Limit orders require --price"),
+    'STOP': ('stop_price', "Stop orders require --stop_price"),
+    'TRAILING_STOP': ('trailing_delta', "Trailing stop orders require --trailing_delta")
+}
+
 def validate_args(args: argparse.Namespace) -> None:
     """Validate command line arguments."""
-    if not args.symbol.isupper():
+    if not args.symbol or not (args.symbol.isascii() and args.symbol == args.symbol.upper()):
         raise ValueError("Symbol must be uppercase (e.g., BTCUSDT)")
         
-    if args.type == 'LIMIT' and not args.price:
-        raise ValueError("Limit orders require --price")
-        
-    if args.type == 'STOP' and not args.stop_price:
-        raise ValueError("Stop orders require --stop_price")
-        
-    if args.type == 'TRAILING_STOP' and not args.trailing_delta:
-        raise ValueError("Trailing stop orders require --trailing_delta")
+    required = _REQUIRED_ARGS.get(args.type)
+    if required and not getattr(args, required[0]):
+        raise ValueError(required[1])
         
     if args.quantity <= 0:
         raise ValueError("Quantity must be positive")
 
+def load_orders(args: argparse.Namespace) -> List[argparse.Namespace]:
+    """
+    Collect the orders requested on the command line.
+    
+    Orders come from repeated --order JSON objects and/or an --orders_file
+    JSON list, using the same keys as the single-order flags (symbol, side,
+    type, quantity, price, stop_price, trailing_delta). Without either, the
+    single-order flags are used; mixing the two is rejected.
+    """
+    specs = []
+    if args.orders_file:
+        with open(args.orders_file) as f:
+            file_specs = json.load(f)
+        if not isinstance(file_specs, list):
+            raise ValueError("--orders_file must contain a JSON list of orders")
+        specs.extend(file_specs)
+    for order in args.order or []:
+        specs.append(json.loads(order))
+        
+    if args.order or args.orders_file:
+        mixed = [name for name in _ORDER_SPEC_TYPES if getattr(args, name) is not None]
+        if mixed:
+            raise ValueError(
+                f"--{', --'.join(mixed)} cannot be combined with --order / --orders_file"
+            )
+    if not specs:
+        missing = [name for name in _REQUIRED_SPEC_KEYS if getattr(args, name) is None]
+        if missing:
+            raise ValueError(
+                f"Missing --{', --'.join(missing)} (or use --order / --orders_file)"
+            )
+        return [args]
+        
+    return [_parse_order_spec(spec) for spec in specs]
+
+def _parse_order_spec(spec) -> argparse.Namespace:
+    """Check one JSON order spec and convert it like the single-order flags."""
+    if not isinstance(spec, dict):
+        raise ValueError(f"Each order must be a JSON object, got: {spec!r}")
+        
+    unknown = set(spec) - set(_ORDER_SPEC_TYPES)
+    if unknown:
+        raise ValueError(
+            f"Unknown order keys {sorted(unknown)} in {spec} "
+            f"(allowed: {', '.join(_ORDER_SPEC_TYPES)})"
+        )
+    missing = [key for key in _REQUIRED_SPEC_KEYS if spec.get(key) is None]
+    if missing:
+        raise ValueError(f"Order {spec} is missing {', '.join(missing)}")
+        
+    order = argparse.Namespace(**dict.fromkeys(_ORDER_SPEC_TYPES))
+    for key, value in spec.items():
+        if value is None:
+            continue
+        convert = _ORDER_SPEC_TYPES[key]
+        try:
+            # float(True) is 1.0, so booleans would pass as numbers
+            if isinstance(value, bool) or (convert is str and not isinstance(value, str)):
+                raise TypeError(key)
+            setattr(order, key, convert(value))
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {key} in order {spec}: {value!r}") from None
+            
+    if order.side not in ORDER_SIDES:
+        raise ValueError(f"Invalid side {order.side!r}, expected one of {ORDER_SIDES}")
+    if order.type not in ORDER_TYPES:
+        raise ValueError(f"Invalid type {order.type!r}, expected one of {ORDER_TYPES}")
+    return order
+
+def print_balance(balance: float) -> None:
+    """Print the available USDT balance."""
+    print(f"\n💰 Available USDT balance: {balance:.2f}")
+
+def print_order_result(response: Union[Dict, Exception]) -> None:
+    """Print a single order response."""
+    if isinstance(response, Exception):
+        print(f"\n Order failed: {str(response)}")
+        return
+        
+    if 'orderId' not in response:
+        print(f"\n Order rejected: {response.get('code')} - {response.get('msg')}")
+        return
+        
+    print("\n🎯 Order Result:")
+    print(f"Order ID: {response['orderId']}")
+    print(f"Symbol: {response['symbol']}")
+    print(f"Type: {response['type']}")
+    print(f"Side: {response['side']}")
+    print(f"Quantity: {response['origQty']}")
+    print(f"Status: {response['status']}")
+    if 'price' in response:
+        print(f"Price: {response['price']}")
+    if 'stopPrice' in response:
+        print(f"Stop Price: {response['stopPrice']}")
+
 def main():
     """Main entry point for the trading bot."""
     parser = argparse.ArgumentParser(
@@ -175,13 +1256,13 @@ def main():
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
     
-    # Required arguments
-    parser.add_argument('--symbol', required=True, help='Trading pair (e.g., BTCUSDT)')
-    parser.add_argument('--side', required=True, choices=['BUY', 'SELL'], help='Order side')
-    parser.add_argument('--type', required=True, 
-                       choices=['MARKET', 'LIMIT', 'STOP', 'TRAILING_STOP'], 
+    # Order arguments (required unless --order / --orders_file is used)
+    parser.add_argument('--symbol', help='Trading pair (e.g., BTCUSDT)')
+    parser.add_argument('--side', choices=ORDER_SIDES, help='Order side')
+    parser.add_argument('--type', 
+                       choices=ORDER_TYPES, 
                        help='Order type')
-    parser.add_argument('--quantity', type=float, required=True, help='Order quantity')
+    parser.add_argument('--quantity', type=float, help='Order quantity')
     
     # Conditional arguments
     parser.add_argument('--price', type=float, help='Price for LIMIT orders')
@@ -189,56 +1270,93 @@ def main():
     parser.add_argument('--trailing_delta', type=int, 
                        help='Callback rate (1-100) for TRAILING_STOP orders')
     
+    # Multiple orders
+    parser.add_argument('--order', action='append',
+                       help='Order as a JSON object, e.g. '
+                            '\'{"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "quantity": 0.01}\' '
+                            '(repeatable)')
+    parser.add_argument('--orders_file', help='JSON file containing a list of orders')
+    parser.add_argument('--concurrent', action='store_true',
+                       help='Send multiple orders as concurrent requests instead of batchOrders')
+    
     # API configuration
     parser.add_argument('--api_key', help='Binance API key (optional if in .env)')
     parser.add_argument('--api_secret', help='Binance API secret (optional if in .env)')
+    parser.add_argument('--private_key',
+                       help='Path to an Ed25519 private key PEM, used instead of --api_secret')
     parser.add_argument('--testnet', action='store_true', default=True,
                        help='Use testnet (default)')
     parser.add_argument('--live', action='store_false', dest='testnet',
                        help='Use live exchange')
     
+    # Network configuration
+    parser.add_argument('--proxy',
+                       help='Proxy URL for API traffic (http://, https:// or socks5://; '
+                            'socks5:// does not work with --concurrent), '
+                            'e.g. a host in AWS ap-northeast-1 (Tokyo) near the exchange')
+    parser.add_argument('--endpoint',
+                       help='Futures REST base URL (e.g. https://fapi.binance.com); '
+                            'skips the startup endpoint probe')
+    
     args = parser.parse_args()
     
     try:
-        validate_args(args)
+        orders = load_orders(args)
+        for order in orders:
+            validate_args(order)
         
         # Load configuration
         api_key = args.api_key or os.getenv("BINANCE_API_KEY")
         api_secret = args.api_secret or os.getenv("BINANCE_API_SECRET")
+        private_key_path = args.private_key or os.getenv("BINANCE_PRIVATE_KEY_PATH")
+        private_key = None
+        if private_key_path:
+            with open(private_key_path) as f:
+                private_key = f.read()
         
-        if not api_key or not api_secret:
+        if not api_key or not (api_secret or private_key):
             raise ValueError("API keys must be provided via CLI or .env file")
         
-        # Initialize bot
-        bot = BinanceFuturesBot(api_key, api_secret, args.testnet)
-        
-        # Display balance before trading
-        balance = bot.get_balance()
-        print(f"\n💰 Available USDT balance: {balance:.2f}")
-        
-        # Place order
-        response = bot.place_order(
-            symbol=args.symbol,
-            side=args.side,
-            order_type=args.type,
-            quantity=args.quantity,
-            price=args.price,
-            stop_price=args.stop_price,
-            trailing_delta=args.trailing_delta
-        )
+        order_kwargs = [
+            {
+                'symbol': order.symbol,
+                'side': order.side,
+                'order_type': order.type,
+                'quantity': order.quantity,
+                'price': order.price,
+                'stop_price': order.stop_price,
+                'trailing_delta': order.trailing_delta
+            }
+            for order in orders
+        ]
+        
+        if len(order_kwargs) > 1 and args.concurrent:
+            # The async bot does its own connection setup and balance check
+            responses = asyncio.run(place_orders_concurrently(
+                api_key, api_secret, args.testnet, order_kwargs, private_key,
+                proxy=args.proxy, endpoint=args.endpoint
+            ))
+        else:
+            # Initialize bot
+            bot = BinanceFuturesBot(
+                api_key, api_secret, args.testnet, private_key,
+                proxy=args.proxy, endpoint=args.endpoint
+            )
+            try:
+                # Display balance before trading
+                print_balance(bot.get_balance())
+                
+                # Place order(s)
+                if len(order_kwargs) > 1:
+                    responses = bot.place_batch(order_kwargs)
+                else:
+                    responses = [bot.place_order(**order_kwargs[0])]
+            finally:
+                bot.close()
         
         # Display order results
-        print("\n🎯 Order Result:")
-        print(f"Order ID: {response['orderId']}")
-        print(f"Symbol: {response['symbol']}")
-        print(f"Type: {response['type']}")
-        print(f"Side: {response['side']}")
-        print(f"Quantity: {response['origQty']}")
-        print(f"Status: {response['status']}")
-        if 'price' in response:
-            print(f"Price: {response['price']}")
-        if 'stopPrice' in response:
-            print(f"Stop Price: {response['stopPrice']}")
+        for response in responses:
+            print_order_result(response)
         
     except Exception as e:
         print(f"\n Error: {str(e)}")